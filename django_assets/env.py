@@ -1,10 +1,15 @@
+import logging
+import platform
+import sys
 import threading
+from itertools import chain
 from importlib import import_module
 from importlib.util import find_spec as importlib_find
 
 from django.apps import apps
 from django.contrib.staticfiles import finders
 from django.conf import settings
+from django.core.signals import setting_changed
 from webassets.env import (
     BaseEnvironment, ConfigStorage, Resolver, url_prefix_join)
 
@@ -14,6 +19,12 @@ from django_assets.glob import Globber, has_magic
 __all__ = ('register',)
 
 
+# Default for getattr(), to tell an unset setting from one set to None.
+_MISSING = object()
+
+log = logging.getLogger('django-assets')
+
+
 class DjangoConfigStorage(ConfigStorage):
 
     _mapping = {
@@ -29,8 +40,19 @@ class DjangoConfigStorage(ConfigStorage):
         'url_mapping': 'ASSETS_URL_MAPPING',
     }
 
+    # Keys which map to a fixed setting name; filled in lazily by
+    # ``_transform_key``. ``directory`` and ``url`` are not cached, since
+    # which setting they point to depends on the current settings.
+    _resolved = {}
+
     def _transform_key(self, key):
-        if key.lower() == 'directory':
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+
+        lower_key = key.lower()
+        if lower_key == 'directory':
             if hasattr(settings, 'ASSETS_ROOT'):
                 return 'ASSETS_ROOT'
             if getattr(settings, 'STATIC_ROOT', None):
@@ -38,7 +60,7 @@ class DjangoConfigStorage(ConfigStorage):
                 return 'STATIC_ROOT'
             return 'MEDIA_ROOT'
 
-        if key.lower() == 'url':
+        if lower_key == 'url':
             if hasattr(settings, 'ASSETS_URL'):
                 return 'ASSETS_URL'
             if getattr(settings, 'STATIC_URL', None):
@@ -46,20 +68,29 @@ class DjangoConfigStorage(ConfigStorage):
                 return 'STATIC_URL'
             return 'MEDIA_URL'
 
-        return self._mapping.get(key.lower(), key.upper())
+        name = self._resolved[key] = \
+            self._mapping.get(lower_key, key.upper())
+        return name
+
+    @classmethod
+    def _clear_cached(cls):
+        """Forget the memoized key transformations."""
+        cls._resolved.clear()
 
     def __contains__(self, key):
         return hasattr(settings, self._transform_key(key))
 
     def __getitem__(self, key):
-        if self.__contains__(key):
-            value = self._get_deprecated(key)
-            if value is not None:
-                return value
-            return getattr(settings, self._transform_key(key))
+        name = self._transform_key(key)
+        # Fetch the value right away, rather than testing for it first.
+        value = getattr(settings, name, _MISSING)
+        if value is not _MISSING:
+            deprecated_value = self._get_deprecated(key)
+            if deprecated_value is not None:
+                return deprecated_value
+            return value
         else:
-            raise KeyError("Django settings doesn't define %s" %
-                           self._transform_key(key))
+            raise KeyError("Django settings doesn't define %s" % name)
 
     def __setitem__(self, key, value):
         if not self._set_deprecated(key, value):
@@ -76,6 +107,8 @@ class StorageGlobber(Globber):
 
     def __init__(self, storage):
         self.storage = storage
+        # Set to False once the storage turns out not to support exists().
+        self._supports_exists = True
 
     def isdir(self, path):
         # No API for this, though we could a) check if this is a filesystem
@@ -90,43 +123,73 @@ class StorageGlobber(Globber):
         return False
 
     def listdir(self, path):
+        # The result is only ever iterated once, so there is no need to
+        # build a combined list.
         directories, files = self.storage.listdir(path)
-        return directories + files
+        return chain(directories, files)
 
     def exists(self, path):
+        if not self._supports_exists:
+            return False
         try:
             return self.storage.exists(path)
         except NotImplementedError:
+            self._supports_exists = False
             return False
 
 
+# Whether staticfiles is installed. Determined on first use, so that
+# settings may still be configured after import, and forgotten again by
+# ``reset()`` or when ``INSTALLED_APPS`` is changed (e.g. by
+# ``override_settings``).
+_staticfiles_installed = None
+
+# The storages behind the staticfiles finders, each paired with a globber;
+# collected on first use, and forgotten again by ``reset()`` or when any
+# of the settings the finders depend on change.
+_storage_globbers = None
+
+_FINDER_SETTINGS = frozenset((
+    'INSTALLED_APPS', 'STATICFILES_DIRS', 'STATICFILES_FINDERS',
+    'STATIC_ROOT'))
+
+
 class DjangoResolver(Resolver):
     """Adds support for staticfiles resolving."""
 
     @property
     def use_staticfiles(self):
-        return settings.ASSETS_DEBUG and \
-            'django.contrib.staticfiles' in settings.INSTALLED_APPS
+        global _staticfiles_installed
+        if _staticfiles_installed is None:
+            _staticfiles_installed = \
+                'django.contrib.staticfiles' in settings.INSTALLED_APPS
+        return settings.ASSETS_DEBUG and _staticfiles_installed
+
+    def _get_storage_globbers(self):
+        global _storage_globbers
+        if _storage_globbers is None:
+            globbers = []
+            for finder in finders.get_finders():
+                # Builtin finders use either one of those attributes,
+                # though this does seem to be informal; custom finders
+                # may well use neither. Nothing we can do about that.
+                if hasattr(finder, 'storages'):
+                    storages = finder.storages.values()
+                elif hasattr(finder, 'storage'):
+                    storages = [finder.storage]
+                else:
+                    continue
+                globbers.extend(
+                    (storage, StorageGlobber(storage)) for storage in storages)
+            _storage_globbers = globbers
+        return _storage_globbers
 
     def glob_staticfiles(self, item):
         # The staticfiles finder system can't do globs, but we can
         # access the storages behind the finders, and glob those.
-
-        for finder in finders.get_finders():
-            # Builtin finders use either one of those attributes,
-            # though this does seem to be informal; custom finders
-            # may well use neither. Nothing we can do about that.
-            if hasattr(finder, 'storages'):
-                storages = finder.storages.values()
-            elif hasattr(finder, 'storage'):
-                storages = [finder.storage]
-            else:
-                continue
-
-            for storage in storages:
-                globber = StorageGlobber(storage)
-                for file in globber.glob(item):
-                    yield storage.path(file)
+        for storage, globber in self._get_storage_globbers():
+            for file in globber.glob(item):
+                yield storage.path(file)
 
     def search_for_source(self, ctx, item):
         if not self.use_staticfiles:
@@ -169,11 +232,32 @@ class DjangoEnvironment(BaseEnvironment):
 env = None
 env_lock = threading.RLock()
 
+# ``env``, but only published once autoload() has completed.
+_loaded_env = None
+
+# Lets the worker threads of a parallel autoload() see the environment
+# being loaded; see _import_parallel().
+_autoload_local = threading.local()
+
 def get_env():
+    global env, _loaded_env
+
+    # Once the environment is fully loaded, no locking is required.
+    e = _loaded_env
+    if e is not None:
+        return e
+
+    # Within the worker threads of a parallel autoload(), hand out the
+    # environment being loaded; the lock is held by the waiting caller.
+    e = getattr(_autoload_local, 'env', None)
+    if e is not None:
+        return e
+
     # While the first request is within autoload(), a second thread can come
     # in and without the lock, would use a not-fully-loaded environment.
+    # The lock is reentrant, because the ``assets`` modules we load call
+    # back into this function from the same thread.
     with env_lock:
-        global env
         if env is None:
             env = DjangoEnvironment()
 
@@ -183,11 +267,23 @@ def get_env():
             # ``django_assets``, thus giving us a classic circular dependency
             # issue.
             autoload()
+            _loaded_env = env
         return env
 
 def reset():
-    global env
-    env = None
+    global env, _loaded_env, _staticfiles_installed, _storage_globbers
+    env = _loaded_env = None
+    _staticfiles_installed = _storage_globbers = None
+    DjangoConfigStorage._clear_cached()
+
+def _setting_changed(setting, **kwargs):
+    # Sent by ``override_settings``; drop what we derived from the setting.
+    global _staticfiles_installed, _storage_globbers
+    if setting == 'INSTALLED_APPS':
+        _staticfiles_installed = None
+    if setting in _FINDER_SETTINGS:
+        _storage_globbers = None
+setting_changed.connect(_setting_changed)
 
 # The user needn't know about the env though, we can expose the
 # relevant functionality directly. This is also for backwards-compatibility
@@ -232,21 +328,88 @@ def autoload():
     # dependency.
     from django.conf import settings
 
-    for app in apps.get_app_configs():
+    with env_lock:
+        # Another thread may have finished loading while we were waiting.
+        if _ASSETS_LOADED:
+            return False
+
         # For each app, we need to look for an assets.py inside that
-        # app's package.
+        # app's package. Checking first, rather than attempting the
+        # import and inspecting the failure, spares us an exception for
+        # every app without one; errors raised by an existing module
+        # bubble up.
+        modules = ["{}.assets".format(app.name)
+                   for app in apps.get_app_configs()
+                   if module_has_submodule(app.module, 'assets')]
+
+        if getattr(settings, 'ASSETS_PARALLEL_AUTOLOAD', False) and \
+                len(modules) > 1:
+            reason = _no_parallel_reason()
+            if reason is None:
+                _import_parallel(env, modules)
+                modules = []
+            else:
+                log.debug('Not loading assets modules in parallel: %s',
+                          reason)
+
+        # Import the apps' modules, and then any additional ones, which
+        # are expected to exist and so are imported without probing.
+        for module in chain(modules, getattr(settings, 'ASSETS_MODULES', ())):
+            import_module("%s" % module)
+
+        _ASSETS_LOADED = True
+
+
+def _no_parallel_reason():
+    """Return why autoload() has to import the ``assets`` modules one
+    after the other, or ``None`` if they can be imported in parallel.
+    """
+    # Parallel loading needs the environment to hand to the workers,
+    # i.e. we need to have been called by get_env().
+    if env is None:
+        return 'autoload() was not called through get_env()'
+    # It also must not happen from within an import: the workers may
+    # need the import lock of the module this thread is importing, and
+    # would wait for it forever. We can only tell on CPython.
+    if platform.python_implementation() != 'CPython':
+        return 'only supported on CPython'
+    if _importing():
+        return 'get_env() was first called during an import'
+    return None
+
+
+def _importing():
+    """Return whether the current thread is in the middle of importing
+    a module. This relies on CPython's import machinery, where every
+    import runs through ``importlib._bootstrap._find_and_load``.
+    """
+    from importlib import _bootstrap
+    find_and_load = _bootstrap._find_and_load.__code__
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code is find_and_load:
+            return True
+        frame = frame.f_back
+    return False
+
+
+def _import_parallel(loading_env, modules):
+    """Import ``modules`` using a pool of threads, so that any I/O they
+    do while being imported can overlap. Once all of them are done, the
+    first error raised, if any, is re-raised.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
+    def load(module):
+        # The modules will call get_env(), which would otherwise wait for
+        # the lock that our caller is holding.
+        _autoload_local.env = loading_env
         try:
-            import_module("{}.assets".format(app.name))
-        except Exception:
-            # Decide whether to bubble up this error. If the app just
-            # doesn't have the module in question, we can ignore the error
-            # attempting to import it, otherwise we want it to bubble up.
-            if module_has_submodule(app.module, 'assets'):
-                raise
-
-    # Load additional modules.
-    for module in getattr(settings, 'ASSETS_MODULES', []):
-        import_module("%s" % module)
-
-    _ASSETS_LOADED = True
+            import_module(module)
+        finally:
+            del _autoload_local.env
+
+    with ThreadPoolExecutor(max_workers=min(8, len(modules))) as pool:
+        futures = [pool.submit(load, module) for module in modules]
+    for future in futures:
+        future.result()
@@ -27,14 +27,22 @@ from os import path
 import logging
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import setting_changed
 
 from webassets.script import (CommandError as AssetCommandError,
                               GenericArgparseImplementation)
-from django_assets.env import get_env, autoload
+from django_assets.env import get_env
 from django_assets.loaders import get_django_template_dirs, DjangoLoader
 from django_assets.manifest import DjangoManifest  # noqa: enables the --manifest django option
 
 
+# Set up the log once, so that running the command repeatedly within the
+# same process does not attach more and more handlers.
+log = logging.getLogger('django-assets')
+if not log.handlers:
+    log.addHandler(logging.StreamHandler())
+
+
 class Command(BaseCommand):
     help = 'Manage assets.'
     requires_system_checks = False
@@ -49,14 +57,11 @@ class Command(BaseCommand):
         parser.add_argument('args', nargs=argparse.REMAINDER)
 
     def handle(self, *args, **options):
-        # Due to the use of LaxOptionParser ``args`` now contains all
+        # Due to the argparse.REMAINDER argument, ``args`` now contains all
         # unparsed options, and ``options`` those that the Django command
         # has declared.
 
-        # Create log
-        log = logging.getLogger('django-assets')
         log.setLevel({0: logging.WARNING, 1: logging.INFO, 2: logging.DEBUG}[int(options.get('verbosity', 1))])
-        log.addHandler(logging.StreamHandler())
 
         # If the user requested it, search for bundles defined in templates
         if options.get('parse_templates'):
@@ -64,8 +69,10 @@ class Command(BaseCommand):
             # Note that we exclude container bundles. By their very nature,
             # they are guaranteed to have been created by solely referencing
             # other bundles which are already registered.
-            get_env().add(*[b for b in self.load_from_templates()
-                            if not b.is_container])
+            env = get_env()
+            for bundle in self.load_from_templates():
+                if not bundle.is_container:
+                    env.add(bundle)
 
         if len(get_env()) == 0:
             log.info("No asset bundles were found. "
@@ -93,31 +100,61 @@ class Command(BaseCommand):
         bundles = DjangoLoader().load_bundles()
 
         # Using the Jinja loader, if available
-        try:
-            import jinja2
-        except ImportError:
-            pass
-        else:
-            from webassets.ext.jinja2 import Jinja2Loader, AssetsExtension
-
-            jinja2_envs = []
-            # Prepare a Jinja2 environment we can later use for parsing.
-            # If not specified by the user, put in there at least our own
-            # extension, which we will need most definitely to achieve anything.
-            _jinja2_extensions = getattr(settings, 'ASSETS_JINJA2_EXTENSIONS', False)
-            if not _jinja2_extensions:
-                _jinja2_extensions = [AssetsExtension.identifier]
-            jinja2_envs.append(jinja2.Environment(extensions=_jinja2_extensions))
-
-            try:
-                from coffin.common import get_env as get_coffin_env
-            except ImportError:
-                pass
-            else:
-                jinja2_envs.append(get_coffin_env())
-
+        jinja2 = _get_jinja2_envs()
+        if jinja2 is not None:
+            Jinja2Loader, jinja2_envs = jinja2
             bundles.extend(Jinja2Loader(get_env(),
                                         get_django_template_dirs(),
                                         jinja2_envs).load_bundles())
 
         return bundles
+
+
+# Set up by _get_jinja2_envs(); an empty tuple if Jinja2 is not installed.
+# This is kept for the life of the process; ``django_assets.env.reset()``
+# does not clear it, only a change of ``ASSETS_JINJA2_EXTENSIONS`` (e.g.
+# by ``override_settings``) does.
+_jinja2_envs = None
+
+def _setting_changed(setting, **kwargs):
+    global _jinja2_envs
+    if setting == 'ASSETS_JINJA2_EXTENSIONS':
+        _jinja2_envs = None
+setting_changed.connect(_setting_changed)
+
+def _get_jinja2_envs():
+    """Return the ``Jinja2Loader`` class and the Jinja2 environments to
+    parse templates with, or ``None`` if Jinja2 is not installed.
+
+    The environments are only set up once, see ``_jinja2_envs``.
+    """
+    global _jinja2_envs
+    if _jinja2_envs is not None:
+        return _jinja2_envs or None
+
+    try:
+        import jinja2
+    except ImportError:
+        _jinja2_envs = ()
+        return None
+
+    from webassets.ext.jinja2 import Jinja2Loader, AssetsExtension
+
+    jinja2_envs = []
+    # Prepare a Jinja2 environment we can later use for parsing.
+    # If not specified by the user, put in there at least our own
+    # extension, which we will need most definitely to achieve anything.
+    _jinja2_extensions = getattr(settings, 'ASSETS_JINJA2_EXTENSIONS', False)
+    if not _jinja2_extensions:
+        _jinja2_extensions = [AssetsExtension.identifier]
+    jinja2_envs.append(jinja2.Environment(extensions=_jinja2_extensions))
+
+    try:
+        from coffin.common import get_env as get_coffin_env
+    except ImportError:
+        pass
+    else:
+        jinja2_envs.append(get_coffin_env())
+
+    _jinja2_envs = (Jinja2Loader, jinja2_envs)
+    return _jinja2_envs
@@ -10,21 +10,21 @@ import multiprocessing
 # module, though that requires dependencies to be already installed,
 # which may not be the case when processing a pip requirements
 # file, for example.
-def parse_version(assignee):
+def parse_versions():
     import os, re
+    from ast import literal_eval
     here = os.path.dirname(os.path.abspath(__file__))
     version_re = re.compile(
-        r'%s = (\(.*?\))' % assignee)
+        r'^(__version__|__webassets_version__) = (\(.*?\))', re.M)
     with open(os.path.join(here, 'django_assets', '__init__.py')) as fp:
-        for line in fp:
-            match = version_re.search(line)
-            if match:
-                version = eval(match.group(1))
-                return ".".join(map(str, version))
-        else:
-            raise Exception("cannot find version")
-version = parse_version('__version__')
-webassets_version = parse_version('__webassets_version__')
+        versions = {
+            match.group(1): ".".join(map(str, literal_eval(match.group(2))))
+            for match in version_re.finditer(fp.read())}
+    try:
+        return versions['__version__'], versions['__webassets_version__']
+    except KeyError:
+        raise Exception("cannot find version")
+version, webassets_version = parse_versions()
 
 
 setup(
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
+import sys
+from contextlib import contextmanager
 from nose import SkipTest
 from nose.tools import assert_raises, assert_raises_regexp
 
 from django.conf import settings
 from django.contrib.staticfiles import finders
 from django.template import Template, Context
+from django.test import override_settings
 from django_assets.loaders import DjangoLoader
 from django_assets import Bundle, register as django_env_register
+from django_assets import env as django_env
 from django_assets.env import get_env
 from django_assets.env import reset as django_env_reset
 from webassets import six
@@ -95,6 +99,145 @@ class TestConfig(object):
         # Also, we are caseless.
         assert get_env().config['foO'] == 42
 
+    def test_reset_clears_key_cache(self):
+        """The memoized key transformations are forgotten on reset.
+        """
+        get_env().config['url_expire']
+        assert django_env.DjangoConfigStorage._resolved
+        django_env_reset()
+        assert django_env.DjangoConfigStorage._resolved == {}
+
+
+class TestAutoload(TempDirHelper):
+    """The ``assets`` modules of installed apps are loaded.
+    """
+
+    def setup(self):
+        TempDirHelper.setup(self)
+        sys.path.insert(0, self.tempdir)
+        self._assets_loaded = django_env._ASSETS_LOADED
+
+    def teardown(self):
+        sys.path.remove(self.tempdir)
+        for name, module in list(sys.modules.items()):
+            if (getattr(module, '__file__', None) or '').startswith(
+                    self.tempdir):
+                del sys.modules[name]
+        TempDirHelper.teardown(self)
+        django_env_reset()
+        django_env._ASSETS_LOADED = self._assets_loaded
+
+    def create_apps(self, **modules):
+        """Create an app for each keyword, with the value as the source
+        of its ``assets`` module.
+        """
+        for app, source in modules.items():
+            self.create_files({
+                '%s/__init__.py' % app: '',
+                '%s/assets.py' % app: source,
+            })
+
+    @contextmanager
+    def installed(self, *apps, **extra_settings):
+        """Install ``apps``, and prepare for the autoload process to
+        run again on the next get_env().
+        """
+        import importlib
+        importlib.invalidate_caches()
+        with override_settings(INSTALLED_APPS=['django_assets'] + list(apps),
+                               **extra_settings):
+            django_env_reset()
+            django_env._ASSETS_LOADED = False
+            yield
+
+    def load(self, *apps, **extra_settings):
+        """Rerun the autoload process with ``apps`` installed, and
+        return the new environment.
+        """
+        with self.installed(*apps, **extra_settings):
+            return get_env()
+
+    def test_get_env_within_assets_module(self):
+        """An ``assets`` module calling get_env() is given the
+        environment being loaded.
+        """
+        self.create_apps(app1='from django_assets.env import get_env\n'
+                              'ENV = get_env()\n')
+        env = self.load('app1')
+        assert sys.modules['app1.assets'].ENV is env
+
+    def test_only_loads_once(self):
+        """Once done, autoload() does not run again.
+        """
+        self.create_apps(app1='from django_assets import register, Bundle\n'
+                              'register("foo", Bundle("a"))\n')
+        env = self.load('app1')
+        assert django_env.autoload() is False
+        assert list(env._named_bundles) == ['foo']
+
+    def test_parallel(self):
+        """With ASSETS_PARALLEL_AUTOLOAD, the modules of all apps are
+        loaded, and their bundles registered.
+        """
+        register = 'from django_assets import register, Bundle\n' \
+                   'register("%s", Bundle("a"))\n'
+        self.create_apps(app1=register % 'foo', app2=register % 'bar',
+                         app3=register % 'baz')
+        env = self.load('app1', 'app2', 'app3',
+                        ASSETS_PARALLEL_AUTOLOAD=True)
+        assert sorted(env._named_bundles) == ['bar', 'baz', 'foo']
+
+    def test_parallel_error(self):
+        """When loading in parallel, the first error raised by an
+        ``assets`` module bubbles up.
+        """
+        self.create_apps(app1='raise ValueError("first")',
+                         app2='raise ValueError("second")')
+        assert_raises_regexp(
+            ValueError, 'first', self.load, 'app1', 'app2',
+            ASSETS_PARALLEL_AUTOLOAD=True)
+
+    def test_parallel_within_import(self):
+        """If the environment is first requested while a module is being
+        imported, the apps are loaded one after the other, since the
+        workers may need that module as well.
+        """
+        import os
+        import subprocess
+        self.create_files({
+            'shared_env.py': 'from django_assets.env import get_env\n'
+                             'ENV = get_env()\n',
+        })
+        self.create_apps(app1='', app2='import shared_env')
+
+        # This runs in a separate process: should autoload() deadlock, the
+        # blocked pool workers would also keep this one from exiting.
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = '\n'.join([
+            'import logging, sys',
+            'sys.path[:0] = [%r, %r]' % (self.tempdir, root),
+            'from django.conf import settings',
+            'settings.configure(',
+            '    INSTALLED_APPS=["django_assets", "app1", "app2"],',
+            '    ASSETS_PARALLEL_AUTOLOAD=True)',
+            'import django; django.setup()',
+            'logging.basicConfig(level=logging.DEBUG)',
+            'import shared_env',
+            'from django_assets.env import get_env',
+            'assert shared_env.ENV is get_env()',
+        ])
+        process = subprocess.Popen(
+            [sys.executable, '-c', script],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            stdout, stderr = process.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise AssertionError('autoload() deadlocked')
+        assert process.returncode == 0, stderr.decode('utf-8')
+        assert b'Not loading assets modules in parallel' in stderr
+
 
 class TestTemplateTag():
 
@@ -267,6 +410,64 @@ class TestStaticFiles(TempEnvironmentHelper):
         assert_raises_regexp(
             BundleError, 'using staticfiles finders', bundle.build)
 
+    def test_source_changes(self):
+        """Adding or removing files in the staticfiles directories
+        is reflected by the next build.
+        """
+        import os
+        self.mkbundle('file2', output="out").build()
+        assert self.get("media/out") == "bar"
+
+        # A file in an earlier directory now takes precedence.
+        self.create_files({'foo/file2': 'foo'})
+        self.mkbundle('file2', output="out").build(force=True)
+        assert self.get("media/out") == "foo"
+
+        # Once removed, the file is no longer found.
+        os.unlink(self.path('foo/file2'))
+        os.unlink(self.path('bar/file2'))
+        bundle = self.mkbundle('file2', output="out")
+        assert_raises_regexp(
+            BundleError, 'using staticfiles finders', bundle.build, force=True)
+
+    def test_installed_apps_change(self):
+        """Whether staticfiles is installed is checked again after a
+        reset, and when the setting is overridden.
+        """
+        assert self.env.resolver.use_staticfiles
+
+        with override_settings(INSTALLED_APPS=['django_assets']):
+            assert not self.env.resolver.use_staticfiles
+        assert self.env.resolver.use_staticfiles
+
+        installed_apps = settings.INSTALLED_APPS
+        settings.INSTALLED_APPS = ['django_assets']
+        try:
+            django_env_reset()
+            assert not self.env.resolver.use_staticfiles
+        finally:
+            settings.INSTALLED_APPS = installed_apps
+            django_env_reset()
+
+    def test_storage_globbers_cache(self):
+        """The storages to glob are collected again after a reset, and
+        when the staticfiles settings are overridden.
+        """
+        resolver = self.env.resolver
+        resolver._get_storage_globbers()
+        assert django_env._storage_globbers is not None
+        django_env_reset()
+        assert django_env._storage_globbers is None
+
+        with override_settings(STATICFILES_DIRS=[self.path('bar')]):
+            locations = [storage.location for storage, globber
+                         in resolver._get_storage_globbers()]
+            assert self.path('bar') in locations
+            assert self.path('foo') not in locations
+        locations = [storage.location for storage, globber
+                     in resolver._get_storage_globbers()]
+        assert self.path('foo') in locations
+
     def test_serve_built_files(self):
         """The files we write to STATIC_ROOT are served in debug mode
         using "django_assets.finders.AssetsFinder".